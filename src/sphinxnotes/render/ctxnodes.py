@@ -28,9 +28,23 @@ if TYPE_CHECKING:
     from .ctx import ResolvedContext
 
 
+def _pformat_bounded(obj: Any, maxlen: int = 4096) -> str:
+    """Pretty-format object for report with bounded depth and length, as
+    contexts can be arbitrarily large."""
+    s = pformat(obj, depth=4, width=88, compact=True)
+    if len(s) > maxlen:
+        s = s[:maxlen] + f'\n... [{len(s) - maxlen} chars truncated]'
+    return s
+
+
 class pending_node(nodes.Element):
     """A docutils node to be rendered."""
 
+    # NOTE: nodes.Element still provides __dict__, slots are used for the
+    # attributes every instance has. Hook lists are not slotted, as they
+    # default to class-level empty tuples.
+    __slots__ = ('ctx', 'template', 'inline', 'rendered', '_ctx_pickle_error')
+
     #: The context to be rendered by Jinja template.
     ctx: UnresolvedContext | ResolvedContext
     #: Jinja template for rendering the context.
@@ -50,10 +64,12 @@ class pending_node(nodes.Element):
     type RenderedNodesHook = Callable[[pending_node, list[nodes.Node]], None]
 
     # Hooks for processing render intermediate products.
-    _unresolved_context_hooks: list[UnresolvedContextHook]
-    _resolved_context_hooks: list[ResolvedContextHook]
-    _markup_text_hooks: list[MarkupTextHook]
-    _rendered_nodes_hooks: list[RenderedNodesHook]
+    # NOTE: Hooks are rare, the empty class-level defaults are replaced by
+    # instance lists on first registration, see :meth:`_add_hook`.
+    _unresolved_context_hooks: list[UnresolvedContextHook] | tuple[()] = ()
+    _resolved_context_hooks: list[ResolvedContextHook] | tuple[()] = ()
+    _markup_text_hooks: list[MarkupTextHook] | tuple[()] = ()
+    _rendered_nodes_hooks: list[RenderedNodesHook] | tuple[()] = ()
 
     def __init__(
         self,
@@ -72,25 +88,23 @@ class pending_node(nodes.Element):
 
         # Test whehter ctx pickle-able.
         self._ctx_pickle_error = None
-        if isinstance(ctx, UnresolvedContext) and tmpl.phase != Phase.Parsing:
+        if isinstance(ctx, UnresolvedContext) and tmpl.phase is not Phase.Parsing:
             try:
                 pickle.dumps(ctx)
             except Exception as exc:
                 self._ctx_pickle_error = exc
 
-        # Init hook lists.
-        self._unresolved_context_hooks = []
-        self._resolved_context_hooks = []
-        self._markup_text_hooks = []
-        self._rendered_nodes_hooks = []
-
-    def render(self, host: Host) -> None:
+    def render(self, host: Host, markup_renderer: MarkupRenderer | None = None) -> None:
         """
         The core function for rendering context and template to docutils nodes.
 
         1. UnresolvedContext -> ResolvedContext
         2. TemplateRenderer.render(ResolvedContext) -> Markup Text (``str``)
         3. MarkupRenderer.render(Markup Text) -> doctree Nodes (list[nodes.Node])
+
+        :param markup_renderer: Renderer of ``host``, pass it to share one
+            renderer between nodes rendered by the same host; if not given,
+            a new one is created.
         """
 
         # Make sure the function is called once.
@@ -98,11 +112,16 @@ class pending_node(nodes.Element):
         self.rendered = True
 
         # Clear previous empty reports.
-        Reporter(self).clear_empty()
+        if self.children:
+            Reporter(self).clear_empty()
+        debug = self.template.debug
         # Create debug report.
-        report = Report('Render Report', 'DEBUG', source=self.source, line=self.line)
+        # NOTE: Without debug, the report is attached only on failure, so it
+        # is created then, see :meth:`_report_current_exception`.
+        report = self._new_report() if debug else None
 
         if self._ctx_pickle_error is not None:
+            report = report or self._new_report()
             report.level = 'ERROR'
             report.exception(
                 self._ctx_pickle_error,
@@ -117,7 +136,8 @@ class pending_node(nodes.Element):
         # 1. Prepare context for Jinja template.
         if isinstance(self.ctx, UnresolvedContext):
             pdata = self.ctx
-            report.code(pformat(pdata), lang='python', caption='Unresolved context:')
+            if report is not None:
+                self._report_unresolved_context(report, pdata)
 
             for hook in self._unresolved_context_hooks:
                 hook(self, pdata)
@@ -125,81 +145,64 @@ class pending_node(nodes.Element):
             try:
                 ctx = self.ctx = pdata.resolve(host.env)
             except Exception:
-                report.level = 'ERROR'
-                report.current_exception(
-                    caption='Failed to resolve unresolved context:',
-                    traceback=self.template.debug,
+                return self._report_current_exception(
+                    report, 'Failed to resolve unresolved context:', pdata
                 )
-                self += report
-                return None
         else:
+            pdata = None
             ctx = self.ctx
 
         for hook in self._resolved_context_hooks:
             hook(self, ctx)
 
-        report.code(
-            pformat(ctx),
-            lang='python',
-            caption=f'Resolved context (type: {type(ctx)}):',
-        )
-        report.code(
-            self.template.text,
-            lang='jinja',
-            caption=f'Template (phase: {self.template.phase}):',
-        )
-
         extractx_req = ExtraContextRequest(self.template.phase, self, host.env, host)
-        report.code(
-            pformat(sorted(extra_context_names())),
-            lang='python',
-            caption='Available extra context names:',
-        )
+        if report is not None:
+            self._report_resolved_context(report, ctx)
 
         # 2. Render the template and context to markup text.
         try:
-            markup = TemplateRenderer(self.template.text).render(
+            markup = TemplateRenderer.for_template(self.template).render(
                 ctx,
                 globals={'load_extra': extra_context_loader(extractx_req)},
-                debug=self.template.debug,
+                debug=debug,
             )
         except Exception as e:
             caption = 'Failed to render Jinja template:'
             if isinstance(e, TemplateSyntaxError):
                 caption += f' at line {e.lineno}'
-            report.level = 'ERROR'
-            report.current_exception(caption=caption, traceback=self.template.debug)
-            self += report
-            return
+            return self._report_current_exception(report, caption, pdata, ctx)
 
         for hook in self._markup_text_hooks:
             markup = hook(self, markup)
 
-        report.code(markup, lang='rst', caption='Rendered markup text:')
+        if report is not None:
+            report.code(markup, lang='rst', caption='Rendered markup text:')
 
         # 3. Render the markup text to doctree nodes.
         try:
-            ns, msgs = MarkupRenderer(host).render(markup, inline=self.inline)
+            if markup_renderer is None:
+                markup_renderer = MarkupRenderer(host)
+            ns, msgs = markup_renderer.render(markup, inline=self.inline)
         except Exception:
-            report.level = 'ERROR'
-            report.current_exception(
-                caption=(
-                    'Failed to render markup text '
-                    f'to {"inline " if self.inline else ""}nodes:'
-                ),
-                traceback=self.template.debug,
+            return self._report_current_exception(
+                report,
+                'Failed to render markup text '
+                f'to {"inline " if self.inline else ""}nodes:',
+                pdata,
+                ctx,
+                markup,
             )
-            self += report
-            return
 
-        report.code(
-            '\n\n'.join([n.pformat() for n in ns]),
-            lang='xml',
-            caption=f'Rendered nodes (inline: {self.inline}):',
-        )
-        if msgs:
-            report.text('Systemd messages:')
-            [report.node(msg) for msg in msgs]
+        if report is not None:
+            report.code(
+                '\n\n'.join(n.pformat() for n in ns),
+                lang='xml',
+                caption=f'Rendered nodes (inline: {self.inline}):',
+            )
+            if msgs:
+                report.text('Systemd messages:')
+                for msg in msgs:
+                    report.node(msg)
 
         # 4. Add rendered nodes to container.
         for hook in self._rendered_nodes_hooks:
@@ -208,11 +211,68 @@ class pending_node(nodes.Element):
         # TODO: set_source_info?
         self += ns
 
-        if self.template.debug:
+        if report is not None:
             self += report
 
         return
 
+    def _new_report(self) -> Report:
+        return Report('Render Report', 'DEBUG', source=self.source, line=self.line)
+
+    def _report_unresolved_context(
+        self, report: Report, pdata: UnresolvedContext
+    ) -> None:
+        report.code(
+            _pformat_bounded(pdata),
+            lang='python',
+            caption='Unresolved context:',
+        )
+
+    def _report_resolved_context(self, report: Report, ctx: ResolvedContext) -> None:
+        """Report the resolved context and the template rendered with it."""
+        report.code(
+            _pformat_bounded(ctx),
+            lang='python',
+            caption=f'Resolved context (type: {type(ctx)}):',
+        )
+        report.code(
+            self.template.text,
+            lang='jinja',
+            caption=f'Template (phase: {self.template.phase}):',
+        )
+        report.code(
+            _pformat_bounded(sorted(extra_context_names())),
+            lang='python',
+            caption='Available extra context names:',
+        )
+
+    def _report_current_exception(
+        self,
+        report: Report | None,
+        caption: str,
+        pdata: UnresolvedContext | None = None,
+        ctx: ResolvedContext | None = None,
+        markup: str | None = None,
+    ) -> None:
+        """Turn report into an error of the exception being handled and attach
+        it to self.
+
+        If report is None (not debugging), create one with the contexts,
+        template and markup text involved in the failure, as a debug report
+        would have.
+        """
+        if report is None:
+            report = self._new_report()
+            if pdata is not None:
+                self._report_unresolved_context(report, pdata)
+            if ctx is not None:
+                self._report_resolved_context(report, ctx)
+            if markup is not None:
+                report.code(markup, lang='rst', caption='Rendered markup text:')
+        report.level = 'ERROR'
+        report.current_exception(caption=caption, traceback=self.template.debug)
+        self += report
+
     def unwrap(self, replace_self: bool = False) -> list[nodes.Node]:
         children = self.children
         self.clear()
@@ -240,19 +300,27 @@ class pending_node(nodes.Element):
             # Replace self with inline nodes.
             self.replace_self(children)
 
-        return children, [x for x in reports]
+        return children, reports
 
     def hook_unresolved_context(self, hook: UnresolvedContextHook) -> None:
-        self._unresolved_context_hooks.append(hook)
+        self._add_hook('_unresolved_context_hooks', hook)
 
     def hook_resolved_context(self, hook: ResolvedContextHook) -> None:
-        self._resolved_context_hooks.append(hook)
+        self._add_hook('_resolved_context_hooks', hook)
 
     def hook_markup_text(self, hook: MarkupTextHook) -> None:
-        self._markup_text_hooks.append(hook)
+        self._add_hook('_markup_text_hooks', hook)
 
     def hook_rendered_nodes(self, hook: RenderedNodesHook) -> None:
-        self._rendered_nodes_hooks.append(hook)
+        self._add_hook('_rendered_nodes_hooks', hook)
+
+    def _add_hook(self, name: str, hook: Callable) -> None:
+        hooks = getattr(self, name)
+        if not hooks:
+            # Replace the class-level default.
+            hooks = []
+            setattr(self, name, hooks)
+        hooks.append(hook)
 
     """Methods override from parent."""
 
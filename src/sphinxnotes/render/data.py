@@ -11,7 +11,7 @@ Context data type definitions.
 from __future__ import annotations
 from typing import TYPE_CHECKING, Literal
 import re
-from dataclasses import dataclass, asdict, field as dataclass_field
+from dataclasses import dataclass, field as dataclass_field
 from ast import literal_eval
 
 if TYPE_CHECKING:
@@ -276,12 +276,18 @@ class ParsedData:
           of "{{ attrs.color }}".
         - You can NOT access ``Data.attrs['name']`` by "{{ name }}" cause
           the variable name is taken by ``Data.name``.
+
+        .. note:: ``attrs`` is a shallow copy of ``self.attrs``, nested values
+                  (such as lists) are shared with ``self``.
         """
-        ctx = asdict(self)
-        for k, v in self.attrs.items():
-            if k not in ctx:
-                ctx[k] = v
-        return ctx
+        # NOTE: Do not use dataclasses.asdict, which deep-copies all values.
+        # Attrs come first so that fields win on key conflicts.
+        return {
+            **self.attrs,
+            'name': self.name,
+            'attrs': dict(self.attrs),
+            'content': self.content,
+        }
 
 
 @dataclass
@@ -11,6 +11,7 @@ Provides directives and roles for temporarily rendering data within a document.
 
 from __future__ import annotations
 from typing import TYPE_CHECKING, override, cast
+from functools import cache
 
 from docutils import nodes
 from docutils.parsers.rst import directives
@@ -42,9 +43,12 @@ TEMPLATE_KEY = 'sphinxnotes.render.ext:template'
 SCHEMA_KEY = 'sphinxnotes.render.ext:schema'
 
 
+# Values of phases, available as choices of the ":on:" option.
+_PHASE_VALUES = [x.value for x in Phase]
+
+
 def phase_option_spec(arg):
-    choice = directives.choice(arg, [x.value for x in Phase])
-    return Phase[choice.title()]
+    return Phase(directives.choice(arg, _PHASE_VALUES))
 
 
 class TemplateDefineDirective(SphinxDirective):
@@ -65,6 +69,7 @@ class TemplateDefineDirective(SphinxDirective):
         return []
 
     @staticmethod
+    @cache
     def directive_preset() -> Template:
         return Template("""
 .. code:: py
@@ -81,6 +86,7 @@ class TemplateDefineDirective(SphinxDirective):
    }""")
 
     @staticmethod
+    @cache
     def role_preset() -> Template:
         return Template("""``{{ content or 'None' }}``""")
 
@@ -101,10 +107,12 @@ class SchemaDefineDirective(FreeStyleDirective):
         return []
 
     @staticmethod
+    @cache
     def directive_preset() -> Schema:
         return Schema(name=Field(), attrs=Field(), content=Field())
 
     @staticmethod
+    @cache
     def role_preset() -> Schema:
         return Schema(name=Field(), attrs={}, content=Field())
 
@@ -115,15 +123,18 @@ class FreeDataDefineDirective(BaseDataDefineDirective, FreeStyleDirective):
 
     @override
     def current_schema(self) -> Schema:
-        schema = self.env.temp_data.get(
-            SCHEMA_KEY, SchemaDefineDirective.directive_preset()
+        # NOTE: Presets are only created when no schema is defined.
+        schema = (
+            self.env.temp_data.get(SCHEMA_KEY)
+            or SchemaDefineDirective.directive_preset()
         )
         return cast(Schema, schema)
 
     @override
     def current_template(self) -> Template:
-        tmpl = self.env.temp_data.get(
-            TEMPLATE_KEY, TemplateDefineDirective.directive_preset()
+        tmpl = (
+            self.env.temp_data.get(TEMPLATE_KEY)
+            or TemplateDefineDirective.directive_preset()
         )
         return cast(Template, tmpl)
 
@@ -160,13 +171,16 @@ class FreeDataDefineRole(BaseDataDefineRole):
 
     @override
     def current_schema(self) -> Schema:
-        schema = self.env.temp_data.get(SCHEMA_KEY, SchemaDefineDirective.role_preset())
+        schema = (
+            self.env.temp_data.get(SCHEMA_KEY) or SchemaDefineDirective.role_preset()
+        )
         return cast(Schema, schema)
 
     @override
     def current_template(self) -> Template:
-        tmpl = self.env.temp_data.get(
-            TEMPLATE_KEY, TemplateDefineDirective.role_preset()
+        tmpl = (
+            self.env.temp_data.get(TEMPLATE_KEY)
+            or TemplateDefineDirective.role_preset()
         )
         return cast(Template, tmpl)
 
@@ -17,9 +17,6 @@ from sphinx.util.docutils import SphinxDirective, SphinxRole
 from .. import meta, extra_context, ExtraContext
 from ..extractx import ExtraContextRequest
 from ..template import HostWrapper, Phase
-
-# FIXME:
-from ..utils import find_current_section
 from ..utils.ctxproxy import proxy
 
 if TYPE_CHECKING:
@@ -53,17 +50,9 @@ class DocExtraContext(ExtraContext):
 class SectionExtraContext(ExtraContext):
     @override
     def generate(self, req: ExtraContextRequest) -> Any:
-        if req.phase == Phase.Parsing:
+        if req.phase is Phase.Parsing:
             raise ValueError(f'Not available at phase {req.phase}')
-        if req.node.parent is not None:
-            parent = req.node.parent
-        elif isinstance(req.host, SphinxDirective):
-            parent = req.host.state.parent
-        elif isinstance(req.host, SphinxRole):
-            parent = req.host.inliner.parent
-        else:
-            assert False
-        return proxy(find_current_section(parent))
+        return proxy(req.section)
 
 
 @extra_context('app')
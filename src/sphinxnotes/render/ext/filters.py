@@ -20,7 +20,7 @@ if TYPE_CHECKING:
 
 
 @filter('roles')
-def roles(value: Iterable[str], role: str) -> Iterable[str]:
+def roles(value: Iterable[str], role: str) -> list[str]:
     """Converting list of string to list of reStructuredText role.
 
     For example::
@@ -29,7 +29,8 @@ def roles(value: Iterable[str], role: str) -> Iterable[str]:
 
     Produces ``[":doc:`foo`", ":doc:`bar`"]``.
     """
-    return map(lambda x, role=role: ':%s:`%s`' % (role, x), value)
+    prefix = f':{role}:`'
+    return [f'{prefix}{x}`' for x in value]
 
 
 @filter('jsonify')
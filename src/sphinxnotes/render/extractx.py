@@ -2,14 +2,17 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
+from functools import cached_property
 
 from sphinx.util.docutils import SphinxDirective, SphinxRole
 from sphinx.transforms import SphinxTransform
 
 from .template import Phase
+from .utils import find_current_section
 
 if TYPE_CHECKING:
-    from typing import Any
+    from typing import Any, KeysView
+    from docutils import nodes
     from sphinx.environment import BuildEnvironment
     from .ctxnodes import pending_node
 
@@ -28,6 +31,23 @@ class ExtraContextRequest:
     #: or a :py:class:`~sphinx.transforms.SphinxTransform` during later phases.
     host: SphinxDirective | SphinxRole | SphinxTransform
 
+    @cached_property
+    def section(self) -> nodes.section | None:
+        """The section where the pending node is located.
+
+        Looked up once per request, so loading several extra contexts does
+        not walk up the doctree repeatedly.
+        """
+        if self.node.parent is not None:
+            parent = self.node.parent
+        elif isinstance(self.host, SphinxDirective):
+            parent = self.host.state.parent
+        elif isinstance(self.host, SphinxRole):
+            parent = self.host.inliner.parent
+        else:
+            assert False
+        return find_current_section(parent)
+
 
 class ExtraContext(ABC):
     """Base class of extra context."""
@@ -84,8 +104,10 @@ def extra_context(name: str):
     return decorator
 
 
-def extra_context_names() -> set[str]:
-    return set(REGISTRY._ctxs.keys())
+def extra_context_names() -> KeysView[str]:
+    # NOTE: Return a live view rather than copying the names into a new set,
+    # the view already supports set operations.
+    return REGISTRY._ctxs.keys()
 
 
 def extra_context_loader(request: ExtraContextRequest):
@@ -9,19 +9,38 @@ Rendering Jinja2 template to markup text.
 """
 
 from __future__ import annotations
-from dataclasses import dataclass
-from typing import TYPE_CHECKING, Callable, ClassVar, override
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Callable, ClassVar, override
+from hashlib import sha1
+import os
+from os import path
+from weakref import WeakKeyDictionary
 
 from jinja2.sandbox import SandboxedEnvironment
-from jinja2 import StrictUndefined, DebugUndefined
+from jinja2 import (
+    BaseLoader,
+    FileSystemBytecodeCache,
+    TemplateNotFound,
+    StrictUndefined,
+    DebugUndefined,
+)
 
 from .data import ParsedData
+from .utils.ctxproxy import cache_proxies
 
 if TYPE_CHECKING:
-    from typing import Any
+    from jinja2 import Environment, Template as JinjaTemplate
     from sphinx.application import Sphinx
     from sphinx.environment import BuildEnvironment
     from .ctx import ResolvedContext
+    from .template import Template
+
+
+# Extensions always enabled, and ones additionally enabled in debug mode.
+_BUILTIN_EXTENSIONS = ('jinja2.ext.loopcontrols', 'jinja2.ext.do')
+_DEBUG_EXTENSIONS = ('jinja2.ext.debug',)
+# Undefined type, keyed by whether debug is enabled.
+_UNDEFINED = {False: StrictUndefined, True: DebugUndefined}
 
 
 class JinjaRegistry:
@@ -36,7 +55,7 @@ class JinjaRegistry:
 
     def __init__(self) -> None:
         self._filters = {}
-        self._extensions = []
+        self._extensions = list(_BUILTIN_EXTENSIONS)
 
     def add_filter(
         self, name: str, func: Callable, pass_build_env: bool = False
@@ -55,6 +74,7 @@ class JinjaRegistry:
         if name in self._filters:
             raise ValueError(f'Jinja filter "{name}" already registered')
         self._filters[name] = (func, pass_build_env)
+        _JinjaEnv.on_filter_added(name)
 
     def add_extension(self, extension: str) -> None:
         """Add a Jinja2 extension.
@@ -66,6 +86,7 @@ class JinjaRegistry:
         """
         if extension not in self._extensions:
             self._extensions.append(extension)
+            _JinjaEnv.reset()
 
 
 REGISTRY = JinjaRegistry()
@@ -75,6 +96,16 @@ REGISTRY = JinjaRegistry()
 @dataclass
 class TemplateRenderer:
     text: str
+    #: The template where :attr:`text` comes from, see :meth:`for_template`.
+    #: If given, the compiled template is cached on it rather than looked up
+    #: by text.
+    template: Template | None = field(default=None, repr=False)
+
+    @classmethod
+    def for_template(cls, tmpl: Template) -> TemplateRenderer:
+        """Create a renderer of the text of tmpl, caching the compiled
+        template on tmpl."""
+        return cls(tmpl.text, tmpl)
 
     def render(
         self,
@@ -83,48 +114,153 @@ class TemplateRenderer:
         debug: bool = False,
     ) -> str:
         # Convert data to context dict.
+        # NOTE: No copy is needed here, Jinja2 always merges context and
+        # globals into a fresh dict, see :meth:`jinja2.Template.render`.
         if isinstance(data, ParsedData):
             ctx = data.asdict()
         elif isinstance(data, dict):
-            ctx = data.copy()
+            ctx = data
+        else:
+            raise TypeError(f'Unsupported context type: {type(data)}')
 
-        # Inject globals.
-        if globals:
-            ctx.update(globals)
+        return self._render(ctx, globals or {}, debug=debug)
 
-        return self._render(ctx, debug=debug)
+    def _render(
+        self, ctx: dict[str, Any], globals: dict[str, Any], debug: bool = False
+    ) -> str:
+        env = _JinjaEnv.get(debug)
+        if self.template is None:
+            tmpl = env.get_template(_TextLoader.name(self.text))
+        elif (tmpl := env.compiled.get(self.template)) is None:
+            # NOTE: Two caches are involved. env.compiled is keyed by template
+            # identity, so a hit costs no hashing of the (maybe long) text.
+            # On a miss, env.get_template still looks up Jinja2's own cache
+            # keyed by text (see :class:`_TextLoader`), which shares compiled
+            # templates between Template objects of the same text and with
+            # renderers created without a template.
+            tmpl = env.get_template(_TextLoader.name(self.text))
+            env.compiled[self.template] = tmpl
+        # Globals take precedence over context, in a single merge pass.
+        with cache_proxies():
+            return tmpl.render(ctx, **globals)
+
+
+class _TextLoader(BaseLoader):
+    """Loader of templates whose names contain their own source text.
+
+    Loading templates by name rather than by :meth:`~jinja2.Environment.from_string`
+    makes Jinja2 cache the compiled template (see :attr:`jinja2.Environment.cache`).
+
+    Only names created by :meth:`name` are loadable, so names used in
+    ``{% include %}`` and the like are still not found.
+    """
 
-    def _render(self, ctx: dict[str, Any], debug: bool = False) -> str:
-        extensions = list(REGISTRY._extensions)
-        if debug:
-            extensions.append('jinja2.ext.debug')
+    PREFIX = 'sphinxnotes.render:'
 
-        env = _JinjaEnv(
-            undefined=DebugUndefined if debug else StrictUndefined,
-            extensions=extensions,
-        )
-        # TODO: cache jinja env
+    @classmethod
+    def name(cls, text: str) -> str:
+        return cls.PREFIX + text
 
-        return env.from_string(self.text).render(ctx)
+    @override
+    def get_source(
+        self, environment: Environment, template: str
+    ) -> tuple[str, str | None, Callable[[], bool] | None]:
+        if not template.startswith(self.PREFIX):
+            raise TemplateNotFound(template)
+        return template[len(self.PREFIX) :], None, None
 
 
 class _JinjaEnv(SandboxedEnvironment):
     _env: ClassVar[BuildEnvironment]
+    # Cached environments, keyed by whether debug is enabled.
+    _cache: ClassVar[dict[bool, _JinjaEnv]] = {}
+    # Directory for persisting compiled templates across builds.
+    _bytecode_cache_dir: ClassVar[str | None] = None
+    # Registered filters adapted for Jinja2, shared by cached environments.
+    _filters: ClassVar[dict[str, Callable] | None] = None
+
+    #: Compiled templates keyed by :class:`~sphinxnotes.render.Template`,
+    #: entries are dropped with the template objects.
+    compiled: WeakKeyDictionary[Template, JinjaTemplate]
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
-        for name, (func, pass_build_env) in REGISTRY._filters.items():
-            if pass_build_env:
-                env = self._env
-                self.filters[name] = lambda value, *args, _func=func, **kwargs: _func(
-                    env, value, *args, **kwargs
-                )
-            else:
-                self.filters[name] = func
+        self.filters.update(self._adapted_filters())
+        self.compiled = WeakKeyDictionary()
+
+    @classmethod
+    def _adapted_filters(cls) -> dict[str, Callable]:
+        if cls._filters is None:
+            cls._filters = {
+                name: cls._adapt_filter(func, pass_build_env)
+                for name, (func, pass_build_env) in REGISTRY._filters.items()
+            }
+        return cls._filters
+
+    @classmethod
+    def _adapt_filter(cls, func: Callable, pass_build_env: bool) -> Callable:
+        if not pass_build_env:
+            return func
+
+        # NOTE: BuildEnvironment is looked up on call, so the adapted filter
+        # keeps working across builds.
+        def wrapped(value, *args, **kwargs):
+            return func(cls._env, value, *args, **kwargs)
+
+        return wrapped
+
+    @classmethod
+    def on_filter_added(cls, name: str) -> None:
+        """Make a newly registered filter available to cached environments."""
+        if cls._filters is None:
+            return  # not adapted yet
+        func, pass_build_env = REGISTRY._filters[name]
+        filter = cls._filters[name] = cls._adapt_filter(func, pass_build_env)
+        for env in cls._cache.values():
+            env.filters[name] = filter
+
+    @classmethod
+    def get(cls, debug: bool = False) -> _JinjaEnv:
+        """Return the cached environment, create it if needed."""
+        if (env := cls._cache.get(debug)) is not None:
+            return env
+
+        extensions = REGISTRY._extensions
+        if debug:
+            extensions = extensions + list(_DEBUG_EXTENSIONS)
+
+        bytecode_cache = None
+        if cls._bytecode_cache_dir:
+            # Compiled code depends on extensions, so environments with
+            # different extensions should not share bytecode.
+            digest = sha1('\n'.join(extensions).encode()).hexdigest()[:8]
+            bytecode_cache = FileSystemBytecodeCache(
+                cls._bytecode_cache_dir, f'{digest}-%s.cache'
+            )
+
+        env = cls._cache[debug] = cls(
+            loader=_TextLoader(),
+            undefined=_UNDEFINED[debug],
+            extensions=extensions,
+            bytecode_cache=bytecode_cache,
+        )
+        return env
+
+    @classmethod
+    def reset(cls) -> None:
+        """Drop cached environments, they will be re-created on next use."""
+        cls._cache.clear()
 
     @classmethod
     def on_builder_inited(cls, app: Sphinx):
         cls._env = app.env
+        # Doctree directory is kept between incremental builds and cleaned
+        # along with them.
+        cls._bytecode_cache_dir = path.join(app.doctreedir, 'jinja2-bytecode')
+        os.makedirs(cls._bytecode_cache_dir, exist_ok=True)
+        # Recreate cached environments so that they pick up the bytecode
+        # cache directory.
+        cls.reset()
 
     @override
     def is_safe_attribute(self, obj, attr, value=None):
@@ -137,9 +273,19 @@ class _JinjaEnv(SandboxedEnvironment):
 
         .. seealso:: :class:`..utils.ctxproxy.Proxy`
         """
+        if type(obj) in _PLAIN_TYPES:
+            # For plain values, the check of super class is equivalent to
+            # rejecting the private attributes.
+            return not attr.startswith('_')
         return super().is_safe_attribute(obj, attr, value)
 
 
+# Types of plain context values, see :meth:`_JinjaEnv.is_safe_attribute`.
+_PLAIN_TYPES = frozenset(
+    {str, int, float, bool, type(None), list, tuple, set, frozenset, dict}
+)
+
+
 def filter(name: str, pass_build_env: bool = False):
     """Decorator for adding a filter to the Jinja environment.
 
@@ -163,6 +309,3 @@ def filter(name: str, pass_build_env: bool = False):
 
 def setup(app: Sphinx):
     app.connect('builder-inited', _JinjaEnv.on_builder_inited)
-
-    REGISTRY.add_extension('jinja2.ext.loopcontrols')
-    REGISTRY.add_extension('jinja2.ext.do')
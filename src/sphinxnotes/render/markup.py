@@ -9,7 +9,8 @@ Rendering markup text to doctree nodes.
 """
 
 from __future__ import annotations
-from dataclasses import dataclass
+import re
+from dataclasses import dataclass, field
 from typing import TYPE_CHECKING
 
 from docutils import nodes
@@ -21,76 +22,122 @@ from sphinx.util.docutils import SphinxDirective, SphinxRole, new_document
 from sphinx.transforms import SphinxTransform
 from sphinx.environment.collectors.asset import ImageCollector
 
-from .template import Host
+from .template import Host, host_base
 
 if TYPE_CHECKING:
+    from typing import Any, Callable
     from docutils.nodes import Node, system_message
     from sphinx.parsers import Parser as SphinxParser
 
 logger = logging.getLogger(__name__)
 
+# Characters that may start inline markup: emphasis, literals, roles,
+# references, substitutions, footnotes, standalone URIs/emails and escapes.
+_INLINE_MARKUP_CHARS = re.compile(r'[`*_|\[\]<>:@\\\n]')
+
 
 @dataclass
 class MarkupRenderer:
     host: Host
 
-    def render(
-        self, text: str, inline: bool = False
-    ) -> tuple[list[Node], list[system_message]]:
-        if inline:
-            return self._render_inline(text)
-        else:
-            return self._render(text), []
-
-    def _render(self, text: str) -> list[Node]:
-        if isinstance(self.host, SphinxDirective):
-            return self.host.parse_text_to_nodes(text)
-        elif isinstance(self.host, SphinxTransform):
-            # TODO: dont create parser for every time
+    # Parse functions resolved from the type of host, see :meth:`__post_init__`.
+    _parse: Callable[[str], list[Node]] = field(init=False, repr=False)
+    _parse_inline: Callable[[str], tuple[list[Node], list[system_message]]] = field(
+        init=False, repr=False
+    )
+    # Whether plain inline text may skip parsing, see :meth:`render`.
+    _fast_inline: bool = field(default=False, init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        # Classify the host once rather than on every render.
+        try:
+            base = host_base(self.host)
+        except NotImplementedError:
+            base = None
+
+        if base is SphinxDirective:
+            self._parse = self.host.parse_text_to_nodes
+            self._parse_inline = self.host.parse_inline
+            self._fast_inline = True
+        elif base is SphinxRole:
+            # The memo required by Inliner.parse, the inliner lives as long
+            # as the role, so build it once.
+            inliner = self.host.inliner
+            self._memo = Struct(
+                document=inliner.document,
+                reporter=inliner.reporter,
+                language=inliner.language,
+            )
+            self._parse = self._unsupported
+            self._parse_inline = self._parse_inline_by_role
+            self._fast_inline = True
+        elif base is SphinxTransform:
             if version_info[0] >= 9:
-                parser = self.host.app.registry.create_source_parser(
+                self._parser = self.host.app.registry.create_source_parser(
                     'rst', env=self.host.env, config=self.host.config
                 )
             else:
-                parser = self.host.app.registry.create_source_parser(
+                self._parser = self.host.app.registry.create_source_parser(
                     self.host.app, 'rst'
                 )
-            doc = new_document(
-                self.host.env.docname,
-                settings=self._get_settings(parser, self.host.document),
-            )
-            parser.parse(text, doc)
-
-            # NOTE: Nodes produced by standalone source parser should be fixed
-            # before returning, cause they missed the processing by certain
-            # Sphinx transforms.
-            self._fix_document(doc)
-
-            return doc.children
+            self._settings = self._get_settings(self._parser, self.host.document)
+            self._parse = self._parse_by_transform
+            self._parse_inline = self._parse_inline_by_transform
         else:
-            assert False
+            self._parse = self._parse_inline = self._unsupported
 
-    def _render_inline(self, text: str) -> tuple[list[Node], list[system_message]]:
-        if isinstance(self.host, SphinxDirective):
-            return self.host.parse_inline(text)
-        if isinstance(self.host, SphinxRole):
-            inliner = self.host.inliner
-            memo = Struct(
-                document=inliner.document,
-                reporter=inliner.reporter,
-                language=inliner.language,
-            )
-            return inliner.parse(text, self.host.lineno, memo, inliner.parent)
-        elif isinstance(self.host, SphinxTransform):
-            # Fallback to normal non-inline render then extract inline
-            # elements by self.
-            # FIXME: error seems be ignored?
-            ns = self._render(text)
-            if ns and isinstance(ns[0], nodes.paragraph):
-                ns = ns[0].children
-            return ns, []
+    def render(
+        self, text: str, inline: bool = False
+    ) -> tuple[list[Node], list[system_message]]:
+        if inline:
+            # Fast path: text without any markup is parsed to itself by the
+            # inliner. Not for transforms, which parse inline text as block
+            # (for example, "- foo" becomes a list).
+            if (
+                self._fast_inline
+                and text
+                and text == text.strip()
+                and not _INLINE_MARKUP_CHARS.search(text)
+            ):
+                return [nodes.Text(text)], []
+            return self._parse_inline(text)
         else:
-            assert False
+            return self._parse(text), []
+
+    def _parse_inline_by_role(
+        self, text: str
+    ) -> tuple[list[Node], list[system_message]]:
+        assert isinstance(self.host, SphinxRole)
+        inliner = self.host.inliner
+        return inliner.parse(text, self.host.lineno, self._memo, inliner.parent)
+
+    def _parse_by_transform(self, text: str) -> list[Node]:
+        assert isinstance(self.host, SphinxTransform)
+        doc = new_document(self.host.env.docname, settings=self._settings)
+        self._parser.parse(text, doc)
+
+        # NOTE: Nodes produced by standalone source parser should be fixed
+        # before returning, cause they missed the processing by certain
+        # Sphinx transforms.
+        self._fix_document(doc)
+
+        return doc.children
+
+    def _parse_inline_by_transform(
+        self, text: str
+    ) -> tuple[list[Node], list[system_message]]:
+        # Fallback to normal non-inline render then extract inline
+        # elements by self.
+        # FIXME: error seems be ignored?
+        ns = self._parse_by_transform(text)
+        if ns and isinstance(ns[0], nodes.paragraph):
+            ns = ns[0].children
+        return ns, []
+
+    def _unsupported(self, text: str) -> Any:
+        raise NotImplementedError(
+            f'Rendering markup text is not supported by host {type(self.host)}'
+        )
 
     def _fix_document(self, document: nodes.document) -> None:
         assert isinstance(self.host, SphinxTransform)
@@ -3,6 +3,7 @@
 from __future__ import annotations
 from typing import TYPE_CHECKING, override, final, cast
 from abc import abstractmethod, ABC
+from collections import deque
 
 from docutils import nodes
 from sphinx.util import logging
@@ -13,6 +14,7 @@ from sphinx.transforms.post_transforms import SphinxPostTransform, ReferencesRes
 from .template import HostWrapper, Phase, Template, Host
 from .ctx import UnresolvedContext, ResolvedContext
 from .ctxnodes import pending_node
+from .markup import MarkupRenderer
 
 if TYPE_CHECKING:
     from sphinx.application import Sphinx
@@ -45,8 +47,8 @@ class Pipeline(ABC):
          :py:data:`~sphinxnotes.render.Phase.Resolving` render phase
     """
 
-    #: Queue of pending nodes to be rendered.
-    _q: list[pending_node] | None = None
+    #: Queue of pending nodes to be rendered, in FIFO order.
+    _q: deque[pending_node] | None = None
 
     """Methods to be overridden."""
 
@@ -75,10 +77,19 @@ class Pipeline(ABC):
     def queue_pending_node(self, n: pending_node) -> None:
         """Push back a new :py:class:`~sphinxnotes.render.pending_node` to the
         render queue."""
-        if not self._q:
-            self._q = []
+        if self._q is None:
+            self._q = deque()
         self._q.append(n)
 
+    def _queue_pending_nodes_in(self, doctree: nodes.Node) -> None:
+        """Push back all pending nodes in doctree, in document order."""
+        # NOTE: The doctree is walked once, and all nodes are collected before
+        # rendering any of them: rendering replaces nodes in the doctree,
+        # which must not happen while findall() is walking it.
+        if self._q is None:
+            self._q = deque()
+        self._q.extend(doctree.findall(pending_node))
+
     @final
     def render_queue(self) -> list[pending_node]:
         """
@@ -92,42 +103,56 @@ class Pipeline(ABC):
         The corresponding rendered node will replace it.
         """
 
+        # NOTE: Use lazy %-formatting for debug messages, they are formatted
+        # only when debug logging is enabled.
         logger.debug(
-            f'{type(self)} is running its render queue, '
-            f'{len(self._q or [])} node(s) to render'
+            '%s is running its render queue, %d node(s) to render',
+            type(self),
+            len(self._q) if self._q else 0,
         )
         ns = []
+        host = cast(Host, self)
+        # Shared by all inline nodes, so its doctree is looked up once.
+        wrapper = HostWrapper(host)
+        # Shared by all rendered nodes, created on first use as creating a
+        # renderer for transform is expensive (it creates a source parser).
+        markup_renderer = None
         while self._q:
-            pending = self._q.pop()
+            pending = self._q.popleft()
 
             ok = self.process_pending_node(pending)
             logger.debug(
-                f'{type(self)} is trying to render '
-                f'{pending.source}:{pending.line}, ok? {ok}'
+                '%s is trying to render %s:%s, ok? %s',
+                type(self),
+                pending.source,
+                pending.line,
+                ok,
             )
 
             if not ok:
                 ns.append(pending)
                 continue
 
-            host = cast(Host, self)
-
             # Perform render.
-            pending.render(host)
+            if markup_renderer is None:
+                markup_renderer = MarkupRenderer(host)
+            pending.render(host, markup_renderer)
 
             if pending.parent is None:
                 ns.append(pending)
                 continue
 
             if pending.inline:
-                host_ = HostWrapper(host)
-                pending.unwrap_inline((host_.doctree, pending.parent), replace_self=True)
+                pending.unwrap_inline(
+                    (wrapper.doctree, pending.parent), replace_self=True
+                )
             else:
                 pending.unwrap(replace_self=True)
 
         logger.debug(
-            f'{type(self)} runs out of its render queue, '
-            f'{len(self._q or [])} node(s) hanging'
+            '%s runs out of its render queue, %d node(s) hanging',
+            type(self),
+            len(self._q) if self._q else 0,
         )
 
         return ns
@@ -145,6 +170,9 @@ class BaseContextSource(Pipeline):
     context and interface for processing reStructuredText markup.
     """
 
+    #: The phase of templates rendered by this pipeline.
+    _expected_phase = Phase.Parsing
+
     """Methods to be implemented."""
 
     @abstractmethod
@@ -173,7 +201,7 @@ class BaseContextSource(Pipeline):
         host = cast(SphinxDirective | SphinxRole, self)
         # Set source and line.
         host.set_source_info(n)
-        return n.template.phase == Phase.Parsing
+        return n.template.phase is self._expected_phase
 
 
 class BaseContextDirective(BaseContextSource, SphinxDirective):
@@ -237,31 +265,31 @@ class _ParsedHookTransform(SphinxTransform, Pipeline):
     # Before almost all others.
     default_priority = 100
 
+    _expected_phase = Phase.Parsed
+
     @override
     def process_pending_node(self, n: pending_node) -> bool:
-        return n.template.phase == Phase.Parsed
+        return n.template.phase is self._expected_phase
 
     @override
     def apply(self, **kwargs):
-        for pending in self.document.findall(pending_node):
-            self.queue_pending_node(pending)
-
-        for n in self.render_queue():
-            ...
+        self._queue_pending_nodes_in(self.document)
+        self.render_queue()
 
 
 class _ResolvingHookTransform(SphinxPostTransform, Pipeline):
     # After resolving pending_xref
     default_priority = (ReferencesResolver.default_priority or 10) + 5
 
+    _expected_phase = Phase.Resolving
+
     @override
     def process_pending_node(self, n: pending_node) -> bool:
-        return n.template.phase == Phase.Resolving
+        return n.template.phase is self._expected_phase
 
     @override
     def apply(self, **kwargs):
-        for pending in self.document.findall(pending_node):
-            self.queue_pending_node(pending)
+        self._queue_pending_nodes_in(self.document)
         ns = self.render_queue()
 
         # NOTE: Should no node left.
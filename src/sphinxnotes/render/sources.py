@@ -147,12 +147,11 @@ class StrictDataDefineDirective(BaseDataDefineDirective):
             optional_arguments = 1
 
         assert not isinstance(schema.attrs, Field)
-        option_spec = {}
-        for name, field in schema.attrs.items():
-            if field.required:
-                option_spec[name] = directives.unchanged_required
-            else:
-                option_spec[name] = directives.unchanged
+        required, optional = directives.unchanged_required, directives.unchanged
+        option_spec = {
+            attr: required if field.required else optional
+            for attr, field in schema.attrs.items()
+        }
 
         has_content = schema.content is not None
 
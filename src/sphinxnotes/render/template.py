@@ -1,11 +1,16 @@
 from __future__ import annotations
 from dataclasses import dataclass
 from enum import Enum
+from functools import cached_property
+from typing import TYPE_CHECKING
 
 from docutils import nodes
 from sphinx.transforms import SphinxTransform
 from sphinx.util.docutils import SphinxDirective, SphinxRole
 
+if TYPE_CHECKING:
+    from typing import Any, Callable
+
 
 class Phase(Enum):
     """The phase of rendering template."""
@@ -30,7 +35,9 @@ class Phase(Enum):
         return _ORDER[self] >= _ORDER[other]
 
 
-@dataclass
+# NOTE: Template is immutable and hashed by identity, so it can be used as
+# a cache key directly, see :attr:`~sphinxnotes.render.jinja._JinjaEnv.compiled`.
+@dataclass(frozen=True, slots=True, eq=False, weakref_slot=True)
 class Template:
     #: Jinja template for rendering the context.
     text: str
@@ -46,18 +53,40 @@ class Template:
 #: or a :py:class:`~sphinx.transforms.SphinxTransform` during later phases.
 type Host = SphinxDirective | SphinxRole | SphinxTransform
 
+# Base classes of Host, and the cache of concrete host type -> base class.
+_HOST_BASES = (SphinxDirective, SphinxRole, SphinxTransform)
+_host_bases: dict[type, type[Host]] = {}
+
+
+def host_base(host: Host) -> type[Host]:
+    """Return which base class of :py:type:`Host` the host is an instance of.
+
+    The result is cached per concrete type, so the isinstance chain runs once
+    per host class rather than once per call.
+    """
+    typ = type(host)
+    if (base := _host_bases.get(typ)) is None:
+        for base in _HOST_BASES:
+            if issubclass(typ, base):
+                break
+        else:
+            raise NotImplementedError(f'Unsupported host: {typ}')
+        _host_bases[typ] = base
+    return base
+
+
+# Doctree getters, keyed by base class of host.
+_DOCTREE_GETTERS: dict[type[Host], Callable[[Any], nodes.document]] = {
+    SphinxDirective: lambda v: v.state.document,
+    SphinxRole: lambda v: v.inliner.document,
+    SphinxTransform: lambda v: v.document,
+}
+
 
 @dataclass
 class HostWrapper:
     v: Host
 
-    @property
+    @cached_property
     def doctree(self) -> nodes.document:
-        if isinstance(self.v, SphinxDirective):
-            return self.v.state.document
-        elif isinstance(self.v, SphinxRole):
-            return self.v.inliner.document
-        elif isinstance(self.v, SphinxTransform):
-            return self.v.document
-        else:
-            raise NotImplementedError
+        return _DOCTREE_GETTERS[host_base(self.v)](self.v)
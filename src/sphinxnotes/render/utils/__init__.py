@@ -8,24 +8,32 @@ from docutils import nodes
 from docutils.frontend import get_default_settings
 from docutils.parsers.rst import Parser
 from docutils.parsers.rst.states import Struct, Inliner as RstInliner
-from docutils.utils import new_document
+from docutils.utils import new_document, Reporter as RstReporter
 from sphinx.util import logging
 
 if TYPE_CHECKING:
-    from typing import Literal, Iterable, Callable
+    from typing import Literal, Iterable, Iterator, Callable
     from sphinx.util.docutils import SphinxRole
 
 logger = logging.getLogger(__name__)
 
 
+# NOTE: Both the settings and the parser are reusable across parses, so
+# create them once.
+_RST_SETTINGS = get_default_settings(Parser)  # type: ignore
+# Problems are kept as system_message nodes in document, do not print them.
+_RST_SETTINGS.report_level = RstReporter.SEVERE_LEVEL + 1
+_RST_PARSER = Parser()
+
+
 def parse_text_to_nodes(text: str) -> list[nodes.Node]:
     """
     Utility for parsing standard reStructuredText (without Sphinx-specific features) to nodes.
     Used when there is not a SphinxDirective/SphinxRole available.
     """
     # TODO: markdown support
-    document = new_document('<string>', settings=get_default_settings(Parser))  # type: ignore
-    Parser().parse(text, document)
+    document = new_document('<string>', settings=_RST_SETTINGS)
+    _RST_PARSER.parse(text, document)
     return document.children
 
 
@@ -47,9 +55,9 @@ _Node = TypeVar('_Node', bound=nodes.Node)
 
 
 def find_parent(node: nodes.Node | None, typ: type[_Node]) -> _Node | None:
-    if node is None or isinstance(node, typ):
-        return node
-    return find_parent(node.parent, typ)
+    while node is not None and not isinstance(node, typ):
+        node = node.parent
+    return node
 
 
 def find_current_section(node: nodes.Node | None) -> nodes.section | None:
@@ -61,27 +69,51 @@ def find_current_document(node: nodes.Node | None) -> nodes.document | None:
 
 
 def find_first_child(node: nodes.Element, cls: type[_Node]) -> _Node | None:
-    if (index := node.first_child_matching_class(cls)) is None:
+    # Fast path: the wanted child usually comes first (title of section,
+    # term of definition list item, and so on).
+    children = node.children
+    if children and isinstance(children[0], cls):
+        return cast(_Node, children[0])
+    if (index := node.first_child_matching_class(cls, start=1)) is None:
         return None
     return cast(_Node, node[index])
 
 
+# Node type -> type of its child that acts as the node's title.
+_TITULAR_CHILD: dict[type[nodes.Node], type[nodes.Element]] = {
+    nodes.section: nodes.title,
+    nodes.sidebar: nodes.title,
+    nodes.definition_list_item: nodes.term,
+    nodes.field: nodes.field_name,
+    nodes.list_item: nodes.paragraph,
+}
+# Cache of :data:`_TITULAR_CHILD` lookups, including subclasses of its keys.
+_titular_child_cache: dict[type, type[nodes.Element] | None] = {}
+
+
+def _titular_child(typ: type) -> type[nodes.Element] | None:
+    try:
+        return _titular_child_cache[typ]
+    except KeyError:
+        child = next(
+            (_TITULAR_CHILD[t] for t in typ.__mro__ if t in _TITULAR_CHILD), None
+        )
+        _titular_child_cache[typ] = child
+        return child
+
+
 def find_titular_node_upward(node: nodes.Element | None) -> nodes.Element | None:
-    if node is None:
-        return None
-    if isinstance(node, (nodes.section, nodes.sidebar)):
-        if title := find_first_child(node, nodes.title):
-            return title
-    if isinstance(node, nodes.definition_list_item):
-        if term := find_first_child(node, nodes.term):
-            return term
-    if isinstance(node, nodes.field):
-        if field := find_first_child(node, nodes.field_name):
-            return field
-    if isinstance(node, nodes.list_item):
-        if para := find_first_child(node, nodes.paragraph):
-            return para
-    return find_titular_node_upward(node.parent)
+    while node is not None:
+        if (cls := _titular_child(type(node))) is not None:
+            if child := find_first_child(node, cls):
+                return child
+        node = node.parent
+    return None
+
+
+_BLOCK_TYPES = (nodes.Body, nodes.Structural, nodes.document)
+# Cache of whether a node type is a subclass of :data:`_BLOCK_TYPES`.
+_is_block_type: dict[type, bool] = {}
 
 
 def find_nearest_block_element(node: nodes.Node | None) -> nodes.Element | None:
@@ -89,9 +121,13 @@ def find_nearest_block_element(node: nodes.Node | None) -> nodes.Element | None:
     Finds the nearest ancestor that is suitable for block-level placement.
     Typically a Body element (paragraph, table, list) or Structural element (section).
     """
-    while node:
-        if isinstance(node, (nodes.Body, nodes.Structural, nodes.document)):
-            return node
+    # NOTE: Compare with None, an element without children is falsy.
+    while node is not None:
+        typ = type(node)
+        if (is_block := _is_block_type.get(typ)) is None:
+            is_block = _is_block_type[typ] = issubclass(typ, _BLOCK_TYPES)
+        if is_block:
+            return cast(nodes.Element, node)
         node = node.parent
     return None
 
@@ -150,16 +186,11 @@ class Report(nodes.system_message):
             self.node(blk)
 
     def list(self, lines: Iterable[str]) -> None:
-        bullet_list = nodes.bullet_list(bullet='*')
-
-        for line in lines:
-            list_item = nodes.list_item()
-            para = nodes.paragraph()
-            para += nodes.Text(line)
-            list_item += para
-            bullet_list += list_item
-
-        self.node(bullet_list)
+        items = [
+            nodes.list_item('', nodes.paragraph('', '', nodes.Text(line)))
+            for line in lines
+        ]
+        self.node(nodes.bullet_list('', *items, bullet='*'))
 
     def traceback(self, caption: str | None = None) -> None:
         # https://pygments.org/docs/lexers/#pygments.lexers.python.PythonTracebackLexer
@@ -213,27 +244,36 @@ class Report(nodes.system_message):
         return prb
 
 
-@dataclass
+@dataclass(slots=True)
 class Reporter:
     """A helper class for storing :class:`Report` to nodes."""
 
     node: nodes.Element
 
     @property
-    def reports(self) -> list[Report]:
-        """Use ``node += Report('xxx')`` to append a report."""
-        return [x for x in self.node if isinstance(x, Report)]
+    def reports(self) -> Iterator[Report]:
+        """Iterate over reports of node lazily, use ``list(reporter.reports)``
+        if a list is needed.
+
+        Use ``node += Report('xxx')`` to append a report."""
+        return (x for x in self.node.children if isinstance(x, Report))
 
     def append(self, report: Report) -> None:
         self.node += report
 
     def clear(self, pred: Callable[[Report], bool] | None = None) -> list[Report]:
         """Clear report children from node if pred returns True."""
-        msgs = []
-        for report in self.reports:
-            if not pred or pred(report):
-                msgs.append(report)
-                self.node.remove(report)
+        # NOTE: Rebuild children in a single pass rather than calling
+        # node.remove() per report, which is O(n) each.
+        keep, msgs = [], []
+        for child in self.node.children:
+            if isinstance(child, Report) and (not pred or pred(child)):
+                child.parent = None
+                msgs.append(child)
+            else:
+                keep.append(child)
+        if msgs:
+            self.node.children[:] = keep
         return msgs
 
     def clear_empty(self) -> list[Report]:
@@ -1,16 +1,43 @@
+from contextlib import contextmanager
+from contextvars import ContextVar
 from dataclasses import dataclass
 from functools import wraps
-from typing import Any, Callable
+from typing import Any, Callable, Iterator
 from types import MappingProxyType
 
 from docutils import nodes
-from sphinx.util import logging
 from sphinx.config import Config as SphinxConfig
 
 from ..utils import find_first_child
 
-
-logger = logging.getLogger(__name__)
+# Values of these exact types are put into context as is.
+_PRIMITIVES = frozenset({str, int, float, bool, type(None)})
+# Types whose values are normalized as is: primitives, plus subclasses of
+# primitives and proxies learned by :meth:`Proxy._normalize`.
+_as_is_types: set[type] = set(_PRIMITIVES)
+# Container types whose items are normalized.
+_CONTAINER_TYPES = frozenset({list, tuple, dict, set, frozenset})
+
+# Proxies created in the current :func:`cache_proxies` scope, keyed by id of
+# the proxied object. The proxy references the object, so the id can not be
+# reused while the entry is alive.
+_proxy_cache: ContextVar['dict[int, Proxy] | None'] = ContextVar(
+    '_proxy_cache', default=None
+)
+
+
+@contextmanager
+def cache_proxies() -> Iterator[None]:
+    """Reuse proxies of the same object within the scope, for example,
+    a template rendering."""
+    if _proxy_cache.get() is not None:
+        yield  # already in scope
+        return
+    token = _proxy_cache.set({})
+    try:
+        yield
+    finally:
+        _proxy_cache.reset(token)
 
 
 def proxy_property(func: Callable[[Any], Any]) -> property:
@@ -22,7 +49,7 @@ def proxy_property(func: Callable[[Any], Any]) -> property:
 
 
 # FIXME: Unpicklable?
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Proxy:
     """
     Proxy complex objects into context for convenient and secure access within
@@ -48,37 +75,64 @@ class Proxy:
 
     @staticmethod
     def _wrap(v: Any) -> Any:
+        cache = _proxy_cache.get()
+        if cache is not None and (p := cache.get(id(v))) is not None:
+            return p
+
         cls = SPECIFIC_TYPE_REGISTRY.get(type(v))
-        if cls:
-            return cls(v)
-        for types, cls in TYPE_REGISTRY.items():
-            if isinstance(v, types):
-                return cls(v)
-        return v
+        if not cls:
+            for types, cls in TYPE_REGISTRY.items():
+                if isinstance(v, types):
+                    break
+            else:
+                return v
+
+        p = cls(v)
+        if cache is not None:
+            cache[id(v)] = p
+        return p
 
     @staticmethod
     def _normalize(val: Any) -> Any:
-        if val is None or isinstance(val, (str, int, float, bool)):
+        # Fast path: dispatch on exact type, which is the common case.
+        typ = type(val)
+        if typ in _as_is_types:
             return val
 
-        if isinstance(val, Proxy):
-            return val
-
-        wrapped_val = Proxy._wrap(val)
-        if wrapped_val is not val:
-            return wrapped_val
-
-        if isinstance(val, (set, frozenset)):
-            return frozenset(Proxy._normalize(x) for x in val)
-        if isinstance(val, (list, tuple)):
-            return tuple(Proxy._normalize(x) for x in val)
-        if isinstance(val, dict):
-            copied = {k: Proxy._normalize(v) for k, v in val.items()}
+        if typ not in _CONTAINER_TYPES:
+            # Slow path: proxies, objects to be proxied and subclasses of the
+            # above types (for example, :class:`docutils.nodes.Text` is a str).
+            if isinstance(val, (str, int, float, bool, Proxy)):
+                _as_is_types.add(typ)
+                return val
+
+            wrapped_val = Proxy._wrap(val)
+            if wrapped_val is not val:
+                return wrapped_val
+
+            if isinstance(val, (set, frozenset)):
+                typ = frozenset
+            elif isinstance(val, (list, tuple)):
+                typ = tuple
+            elif isinstance(val, dict):
+                typ = dict
+            else:
+                return str(val)
+
+        # NOTE: Items of as-is types are kept inline rather than by calling
+        # _normalize recursively, which saves a call per item for flat
+        # containers, the common case.
+        as_is, normalize = _as_is_types, Proxy._normalize
+        if typ is dict:
+            copied = {
+                k: v if type(v) in as_is else normalize(v) for k, v in val.items()
+            }
             return MappingProxyType(copied)
-        return str(val)
+        items = [x if type(x) in as_is else normalize(x) for x in val]
+        return frozenset(items) if typ is set or typ is frozenset else tuple(items)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Node(Proxy):
     _obj: nodes.Element
 
@@ -91,33 +145,35 @@ class Node(Proxy):
         return self._obj.astext()
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class NodeWithTitle(Node):
     @proxy_property
     def title(self) -> Node | None:
         return find_first_child(self._obj, nodes.Titular)  # type: ignore
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Section(NodeWithTitle):
     _obj: nodes.section
 
     @proxy_property
     def sections(self) -> tuple['Section', ...]:
-        sect_nodes = self._obj[0].findall(
-            nodes.section, descend=False, ascend=False, siblings=True
+        # NOTE: Subsections are always direct children, scan them rather than
+        # running a findall() generator over the siblings of the first child.
+        return tuple(
+            Proxy._wrap(x) for x in self._obj.children if isinstance(x, nodes.section)
         )
-        return list(sect_nodes)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Document(NodeWithTitle):
     _obj: nodes.document
 
     def _top_section(self) -> Section:
         section = self._obj.next_node(nodes.section)
         assert section
-        return Section(section)
+        # Reuse the proxy within a render, see :func:`cache_proxies`.
+        return Proxy._wrap(section)
 
     @proxy_property
     def title(self) -> Node | None:
@@ -128,7 +184,7 @@ class Document(NodeWithTitle):
         return self._top_section().sections
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Config(Proxy):
     _obj: SphinxConfig
 
@@ -1,4 +1,5 @@
 import re
+from functools import lru_cache
 from typing import Callable, Any
 
 from docutils import nodes
@@ -13,6 +14,8 @@ from ..utils import parse_text_to_nodes
 
 logger = logging.getLogger(__name__)
 
+_FIELD_MARKER_RE = re.compile(Body.patterns['field_marker'])
+
 
 class FreeStyleOptionSpec(dict):
     """
@@ -71,7 +74,7 @@ class FreeStyleDirective(SphinxDirective):
         # Extract options from arguments.
         # See also :meth:`docutils.parsers.rst.Body::parse_directive_options`.
         for i, line in enumerate(arg_block):
-            if re.match(Body.patterns['field_marker'], line):
+            if _FIELD_MARKER_RE.match(line):
                 opt_block = arg_block[i:]
                 arg_block = arg_block[:i]
                 break
@@ -85,7 +88,10 @@ class FreeStyleDirective(SphinxDirective):
         return '\n'.join(arg_block), options
 
     @staticmethod
-    def _parse_field_list(text: str) -> list[tuple[str, str]]:
+    @lru_cache(maxsize=512)
+    def _parse_field_list(text: str) -> tuple[tuple[str, str], ...]:
+        # NOTE: Cached as the same options are often used by many directives,
+        # only the immutable (name, value) pairs are cached, not the nodes.
         field_lists = []
         for node in parse_text_to_nodes(text):
             for field_list in node.findall(nodes.field_list):
@@ -93,4 +99,4 @@ class FreeStyleDirective(SphinxDirective):
                     name = field.children[0].astext()
                     value = field.children[1].astext()
                     field_lists.append((name, value))
-        return field_lists
+        return tuple(field_lists)
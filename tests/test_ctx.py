@@ -1,7 +1,7 @@
 import pickle
 from unittest.mock import MagicMock
 
-from sphinxnotes.render.data import RawData, Schema
+from sphinxnotes.render.data import RawData, ParsedData, Schema
 from sphinxnotes.render.sources import UnparsedData
 
 
@@ -22,3 +22,20 @@ def test_schema_and_unparsed_data_are_picklable():
     assert restored.resolve(mock_env).name == 'mimi'
     assert restored.resolve(mock_env).attrs == {'age': 2, 'tags': ['cat', 'cute']}
     assert restored.resolve(mock_env).content == 'hello'
+
+
+def test_parsed_data_asdict_lifts_attrs_without_overriding_fields():
+    data = ParsedData('mimi', {'color': 'black', 'name': 'lucy'}, None)
+
+    ctx = data.asdict()
+    assert ctx['name'] == 'mimi'
+    assert ctx['color'] == 'black'
+    assert ctx['attrs'] == data.attrs
+
+
+def test_parsed_data_asdict_copies_attrs():
+    data = ParsedData('mimi', {'color': 'black'}, None)
+
+    ctx = data.asdict()
+    ctx['attrs']['color'] = 'white'
+    assert data.attrs == {'color': 'black'}
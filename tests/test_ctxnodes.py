@@ -0,0 +1,75 @@
+import pickle
+from types import SimpleNamespace
+
+from docutils import nodes
+
+from sphinxnotes.render.ctxnodes import pending_node, _pformat_bounded
+from sphinxnotes.render.template import Template
+from sphinxnotes.render.utils import Report
+
+
+def test_hooks_are_per_node():
+    node, other = pending_node({}, Template('')), pending_node({}, Template(''))
+
+    def hook(node, text):
+        return text
+
+    node.hook_markup_text(hook)
+    node.hook_markup_text(hook)
+    assert node._markup_text_hooks == [hook, hook]
+    assert not other._markup_text_hooks
+    assert not pending_node._markup_text_hooks
+
+
+def test_pformat_bounded():
+    assert _pformat_bounded({'a': 1}) == "{'a': 1}"
+    assert _pformat_bounded([[[[[1]]]]]) == '[[[[[...]]]]]'
+    s = _pformat_bounded(list(range(10000)), maxlen=100)
+    assert s.startswith('[0, 1, 2')
+    assert s.endswith('chars truncated]')
+
+
+def test_report_created_on_failure_only():
+    host = SimpleNamespace(env=SimpleNamespace())
+
+    node = pending_node({}, Template('{{ undefined_var }}'))
+    node.render(host)
+    [report] = node.children
+    assert isinstance(report, Report)
+    assert report.level == 'ERROR'
+    assert '{{ undefined_var }}' in report.astext()
+    assert 'Resolved context' in report.astext()
+    assert 'Available extra context names' in report.astext()
+
+    node = pending_node({}, Template('{{ 1 }}'))
+    node._ctx_pickle_error = ValueError('test')
+    node.render(host)
+    [report] = node.children
+    assert report.level == 'ERROR'
+
+
+def test_report_attached_on_success_only_with_debug():
+    host = SimpleNamespace(env=SimpleNamespace())
+    renderer = SimpleNamespace(render=lambda text, inline: ([nodes.Text(text)], []))
+
+    node = pending_node({}, Template('{{ 1 }}'))
+    node.render(host, renderer)
+    assert node.children == [nodes.Text('1')]
+
+    node = pending_node({}, Template('{{ 1 }}', debug=True))
+    node.render(host, renderer)
+    text, report = node.children
+    assert text == nodes.Text('1')
+    assert isinstance(report, Report)
+    assert report.level == 'DEBUG'
+
+
+def test_pickle_roundtrip():
+    node = pending_node({'a': 1}, Template('{{ a }}'), inline=True)
+    node['classes'].append('test')
+    restored = pickle.loads(pickle.dumps(node))
+    assert restored.ctx == {'a': 1}
+    assert restored.template.text == '{{ a }}'
+    assert restored.inline and not restored.rendered
+    assert restored['classes'] == ['test']
+    assert 'ctx' not in vars(restored)
@@ -0,0 +1,81 @@
+from types import MappingProxyType
+
+from docutils import nodes
+from docutils.utils import new_document
+
+from sphinxnotes.render.utils.ctxproxy import (
+    Proxy,
+    Node,
+    Section,
+    proxy,
+    cache_proxies,
+    _as_is_types,
+)
+
+
+def test_normalize_values():
+    assert Proxy._normalize(None) is None
+    assert Proxy._normalize('a') == 'a'
+    assert Proxy._normalize([1, (2, {3})]) == (1, (2, frozenset({3})))
+
+    mapping = Proxy._normalize({'a': [1]})
+    assert isinstance(mapping, MappingProxyType)
+    assert mapping == {'a': (1,)}
+
+    # Subclasses of primitive types are kept as is, even they are nodes.
+    text = nodes.Text('hello')
+    assert Proxy._normalize(text) is text
+
+    para = nodes.paragraph('hello', 'hello')
+    assert isinstance(Proxy._normalize(para), Node)
+    assert Proxy._normalize(object()).startswith('<object object')
+
+
+def test_proxies_have_no_instance_dict():
+    for obj in [nodes.paragraph(), nodes.section(), new_document('<test>')]:
+        p = proxy(obj)
+        assert not hasattr(p, '__dict__')
+        assert p._obj is obj
+
+
+def test_proxies_are_reused_in_cache_scope():
+    para = nodes.paragraph()
+    assert proxy(para) is not proxy(para)
+    with cache_proxies():
+        p = proxy(para)
+        assert proxy(para) is p
+        assert Proxy._normalize([para])[0] is p
+    assert proxy(para) is not p
+
+
+def test_section_sections():
+    sub1, sub2 = nodes.section(), nodes.section()
+    top = nodes.section('', nodes.title('T', 'T'), nodes.paragraph(), sub1, sub2)
+    doc = new_document('<test>')
+    doc += top
+
+    sections = proxy(top).sections
+    assert isinstance(sections, tuple)
+    assert [s._obj for s in sections] == [sub1, sub2]
+    assert all(isinstance(s, Section) for s in sections)
+    assert [s._obj for s in proxy(doc).sections] == [sub1, sub2]
+    assert proxy(sub1).sections == ()
+
+
+def test_normalize_learns_as_is_types():
+    p = proxy(nodes.paragraph())
+    assert Proxy._normalize(p) is p
+    assert type(p) in _as_is_types
+    assert Proxy._normalize(p) is p
+
+
+def test_normalize_container_subclasses():
+    class mylist(list):
+        pass
+
+    class mydict(dict):
+        pass
+
+    para = nodes.paragraph()
+    assert Proxy._normalize(mylist([1, para]))[1]._obj is para
+    assert Proxy._normalize(mydict(a=mylist([1]))) == {'a': (1,)}
@@ -79,6 +79,14 @@ def test_extra_context_rebuild(app, status, warning):
     assert 'all-docs=1' in html
 
 
+@pytest.mark.sphinx('html', testroot='base-context-directive-example')
+def test_jinja_bytecode_cache(app, status, warning):
+    app.build()
+
+    cache_dir = app.doctreedir / 'jinja2-bytecode'
+    assert any(cache_dir.glob('*.cache'))
+
+
 # ===========================
 # Test sphinxnotes.render.ext
 # ===========================
@@ -1,5 +1,7 @@
 from types import SimpleNamespace
 
+from docutils import nodes
+
 from sphinxnotes.render.extractx import (
     ExtraContext,
     ExtraContextRequest,
@@ -55,3 +57,14 @@ def test_extra_context_loader_passes_parameters():
         assert result == {'args': (10,), 'kwargs': {'limit': 20}}
     finally:
         REGISTRY._ctxs.pop(name, None)
+
+
+def test_extra_context_request_looks_up_section_once():
+    node = pending_node({}, Template(''))
+    section = nodes.section('', nodes.paragraph('', '', node))
+    host = SimpleNamespace(env=SimpleNamespace())
+    req = ExtraContextRequest(Template('').phase, node, host.env, host)
+
+    assert req.section is section
+    node.parent = None
+    assert req.section is section
@@ -1,4 +1,10 @@
-from sphinxnotes.render.jinja import TemplateRenderer
+import pytest
+from jinja2 import TemplateNotFound
+
+from sphinxnotes.render.jinja import TemplateRenderer, REGISTRY, _JinjaEnv, _TextLoader
+from sphinxnotes.render.data import ParsedData
+from sphinxnotes.render.ext import filters  # noqa: F401 (registers jsonify)
+from sphinxnotes.render.template import Template
 
 
 def test_template_renderer_injects_template_globals():
@@ -10,3 +16,61 @@ def test_template_renderer_injects_template_globals():
     )
 
     assert rendered == 'loaded:cat'
+
+
+def test_jinja_env_is_cached_and_updated_with_new_filters():
+    env = _JinjaEnv.get()
+    assert _JinjaEnv.get() is env
+    assert _JinjaEnv.get(debug=True) is not env
+
+    REGISTRY.add_filter('test_env_cache', lambda x: x)
+    try:
+        assert _JinjaEnv.get() is env
+        assert 'test_env_cache' in env.filters
+        assert 'test_env_cache' in _JinjaEnv.get(debug=True).filters
+    finally:
+        REGISTRY._filters.pop('test_env_cache', None)
+        _JinjaEnv._filters = None
+        _JinjaEnv.reset()
+
+
+def test_template_renderer_caches_compiled_template():
+    env = _JinjaEnv.get()
+    text = '{{ x }}'
+
+    assert TemplateRenderer(text).render({'x': 1}) == '1'
+    tmpl = env.get_template(_TextLoader.name(text))
+    assert TemplateRenderer(text).render({'x': 2}) == '2'
+    assert env.get_template(_TextLoader.name(text)) is tmpl
+
+
+def test_template_renderer_does_not_load_included_names():
+    with pytest.raises(TemplateNotFound):
+        TemplateRenderer("{% include 'foo' %}").render({})
+
+
+def test_sandbox_still_denies_private_attributes_of_plain_values():
+    env = _JinjaEnv.get()
+
+    assert env.is_safe_attribute({}, 'items')
+    assert not env.is_safe_attribute({}, '_private')
+    assert not env.is_safe_attribute('', '__class__')
+
+
+def test_compiled_template_cached_on_template_object():
+    tmpl = Template('{{ x }}')
+    assert hash(tmpl) != hash(Template('{{ x }}'))
+    assert TemplateRenderer.for_template(tmpl).render({'x': 1}) == '1'
+    compiled = _JinjaEnv.get().compiled[tmpl]
+    assert TemplateRenderer(tmpl.text, tmpl).render({'x': 3}) == '3'
+    assert TemplateRenderer.for_template(tmpl).render({'x': 2}) == '2'
+    assert _JinjaEnv.get().compiled[tmpl] is compiled
+    with pytest.raises(AttributeError):
+        tmpl.text = ''  # type: ignore
+
+
+def test_parsed_data_attrs_are_jsonifiable():
+    data = ParsedData('mimi', {'x': 1, 'tags': ['a', 'b']}, None)
+    assert TemplateRenderer('{{ attrs | jsonify }}').render(data) == (
+        '{"x": 1, "tags": ["a", "b"]}'
+    )
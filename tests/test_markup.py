@@ -0,0 +1,57 @@
+from types import SimpleNamespace
+
+import pytest
+from docutils import nodes
+from sphinx.util.docutils import SphinxRole
+
+from sphinxnotes.render.markup import MarkupRenderer
+
+
+class _Role(SphinxRole):
+    pass
+
+
+def _role_renderer(parsed: list[str]) -> MarkupRenderer:
+    def parse(text, lineno, memo, parent):
+        parsed.append(text)
+        return [nodes.emphasis(text, text)], []
+
+    role = _Role()
+    role.lineno = 1
+    role.inliner = SimpleNamespace(
+        document=None, reporter=None, language=None, parent=None, parse=parse
+    )
+    return MarkupRenderer(role)
+
+
+def test_inline_plain_text_skips_parsing():
+    parsed = []
+    ns, msgs = _role_renderer(parsed).render('hello world', inline=True)
+    assert ns == [nodes.Text('hello world')]
+    assert isinstance(ns[0], nodes.Text)
+    assert msgs == [] and parsed == []
+
+
+@pytest.mark.parametrize(
+    'text',
+    ['`x`', '*x*', '_x', 'x|', '[1]', '<x>', 'a:b', 'a@b', 'a\\b', 'a\nb'],
+)
+def test_inline_markup_chars_are_parsed(text):
+    parsed = []
+    ns, _ = _role_renderer(parsed).render(text, inline=True)
+    assert parsed == [text]
+    assert isinstance(ns[0], nodes.emphasis)
+
+
+@pytest.mark.parametrize('text', [' x', 'x ', '', '\tx'])
+def test_inline_surrounding_whitespace_is_parsed(text):
+    parsed = []
+    _role_renderer(parsed).render(text, inline=True)
+    assert parsed == [text]
+
+
+def test_inline_fast_path_is_limited_to_directives_and_roles():
+    # Other hosts (such as transforms) parse inline text as block.
+    renderer = MarkupRenderer(SimpleNamespace())
+    with pytest.raises(NotImplementedError):
+        renderer.render('hello', inline=True)
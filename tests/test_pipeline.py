@@ -0,0 +1,18 @@
+from sphinxnotes.render.ctxnodes import pending_node
+from sphinxnotes.render.pipeline import Pipeline
+from sphinxnotes.render.template import Template
+
+
+class DeferringPipeline(Pipeline):
+    def process_pending_node(self, n: pending_node) -> bool:
+        return False
+
+
+def test_render_queue_is_fifo():
+    pipeline = DeferringPipeline()
+    pendings = [pending_node({}, Template('')) for _ in range(3)]
+    for pending in pendings:
+        pipeline.queue_pending_node(pending)
+
+    assert pipeline.render_queue() == pendings
+    assert pipeline.render_queue() == []
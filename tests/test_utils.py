@@ -0,0 +1,58 @@
+from docutils import nodes
+
+from sphinxnotes.render.utils import (
+    Report,
+    Reporter,
+    find_first_child,
+    find_nearest_block_element,
+    find_titular_node_upward,
+)
+
+
+def test_find_titular_node_upward():
+    class custom_item(nodes.list_item):
+        pass
+
+    title = nodes.title('Title', 'Title')
+    para = nodes.paragraph('Item', 'Item')
+    inner = nodes.paragraph('Inner', 'Inner')
+    item = custom_item('', para, nodes.bullet_list('', nodes.list_item('', inner)))
+    section = nodes.section('', title, nodes.bullet_list('', item))
+
+    assert find_titular_node_upward(inner.parent) is inner
+    # Subclasses of titular node types are supported.
+    assert find_titular_node_upward(para) is para
+    assert find_titular_node_upward(item) is para
+    assert find_titular_node_upward(section[1]) is title
+    assert find_titular_node_upward(nodes.paragraph()) is None
+
+
+def test_find_first_child():
+    title, para = nodes.title(), nodes.paragraph()
+    assert find_first_child(nodes.section('', title, para), nodes.title) is title
+    assert find_first_child(nodes.section('', title, para), nodes.paragraph) is para
+    assert find_first_child(nodes.section('', para), nodes.title) is None
+    assert find_first_child(nodes.section(), nodes.title) is None
+
+
+def test_reporter_clear():
+    empty, full = Report('empty'), Report('full')
+    full.text('content')
+    para = nodes.paragraph()
+    node = nodes.container('', empty, para, full)
+    children = node.children
+
+    assert Reporter(node).clear_empty() == [empty]
+    assert node.children is children
+    assert node.children == [para, full]
+    assert empty.parent is None
+    assert list(Reporter(node).reports) == [full]
+
+
+def test_find_nearest_block_element():
+    emphasis = nodes.emphasis()
+    para = nodes.paragraph('', '', nodes.strong('', '', emphasis))
+    assert find_nearest_block_element(emphasis) is para
+    # Empty elements are found as well.
+    assert find_nearest_block_element(nodes.paragraph()) is not None
+    assert find_nearest_block_element(nodes.emphasis()) is None